@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import typing as ty
 
 import pydantic
 from pydantic_core import core_schema
 
+if ty.TYPE_CHECKING:
+    import types
+
+
+@functools.lru_cache(maxsize=1)
+def _get_units() -> types.ModuleType:
+    """Get astropy.units, paying the import-system lookup only once"""
+    import astropy.units
+
+    return astropy.units
+
 
 class PhysicalTypeAdapter:
     """A pydantic adapter for astropy.units.PhysicalType"""
@@ -18,7 +30,7 @@ class PhysicalTypeAdapter:
         handler: pydantic.GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
         """Get the pydantic schema for this type"""
-        import astropy.units as u
+        u = _get_units()
 
         from .validators import validate_physical_type
 
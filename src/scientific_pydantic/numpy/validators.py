@@ -1,5 +1,6 @@
 """Validation logic"""
 
+import functools
 import types
 import typing as ty
 from collections.abc import Sequence
@@ -129,12 +130,77 @@ def _matches_spec(dim_size: int, spec: int | range | slice | None) -> bool:
     raise ValueError(msg)
 
 
+# numpy allocates a boolean temporary for each comparison, so for large
+# numeric arrays a compiled single-pass loop that short-circuits on the first
+# violation is much cheaper. numba is optional, like the rest of the
+# scientific stack; without it the numpy reductions are used.
+_KERNEL_MIN_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bounds_kernels() -> dict[str, ty.Callable] | None:  # noqa: C901
+    """Build the numba-compiled bounds kernels, or None if numba is absent"""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # Explicit loops: numba does not reliably compile all(genexp). The
+    # `not (v > bound)` form fails on NaN, matching np.all(arr > bound)
+
+    @numba.njit(cache=True)
+    def all_gt(arr: NDArray, bound: float) -> bool:
+        for v in arr:  # noqa: SIM110
+            if not v > bound:
+                return False
+        return True
+
+    @numba.njit(cache=True)
+    def all_ge(arr: NDArray, bound: float) -> bool:
+        for v in arr:  # noqa: SIM110
+            if not v >= bound:
+                return False
+        return True
+
+    @numba.njit(cache=True)
+    def all_lt(arr: NDArray, bound: float) -> bool:
+        for v in arr:  # noqa: SIM110
+            if not v < bound:
+                return False
+        return True
+
+    @numba.njit(cache=True)
+    def all_le(arr: NDArray, bound: float) -> bool:
+        for v in arr:  # noqa: SIM110
+            if not v <= bound:
+                return False
+        return True
+
+    return {"gt": all_gt, "ge": all_ge, "lt": all_lt, "le": all_le}
+
+
+def _bounds_kernel(arr: NDArray, bound: ty.Any, op: str) -> ty.Callable | None:
+    """Get the compiled kernel for `op` if it is usable on `arr`/`bound`"""
+    if (
+        arr.size < _KERNEL_MIN_SIZE
+        or arr.dtype.kind not in "biuf"
+        or not isinstance(bound, (int, float))
+    ):
+        return None
+    kernels = _get_bounds_kernels()
+    return kernels[op] if kernels is not None else None
+
+
 # bound is Any because we aren't assuming the dtype of the array here
 
 
 def validate_all_gt(arr: ArrT, bound: ty.Any) -> ArrT:
     """Assert all elements in `arr` are > `bound`"""
-    if not np.all(arr > bound):
+    if kernel := _bounds_kernel(arr, bound, "gt"):
+        ok = kernel(arr.ravel(), bound)
+    else:
+        ok = np.all(arr > bound)
+    if not ok:
         err = PydanticCustomError(
             "bounds_error",
             "Not all elements were > {bound}",
@@ -146,7 +212,11 @@ def validate_all_gt(arr: ArrT, bound: ty.Any) -> ArrT:
 
 def validate_all_ge(arr: ArrT, bound: ty.Any) -> ArrT:
     """Assert all elements in `arr` are >= `bound`"""
-    if not np.all(arr >= bound):
+    if kernel := _bounds_kernel(arr, bound, "ge"):
+        ok = kernel(arr.ravel(), bound)
+    else:
+        ok = np.all(arr >= bound)
+    if not ok:
         err = PydanticCustomError(
             "bounds_error",
             "Not all elements were >= {bound}",
@@ -158,7 +228,11 @@ def validate_all_ge(arr: ArrT, bound: ty.Any) -> ArrT:
 
 def validate_all_lt(arr: ArrT, bound: ty.Any) -> ArrT:
     """Assert all elements in `arr` are < `bound`"""
-    if not np.all(arr < bound):
+    if kernel := _bounds_kernel(arr, bound, "lt"):
+        ok = kernel(arr.ravel(), bound)
+    else:
+        ok = np.all(arr < bound)
+    if not ok:
         err = PydanticCustomError(
             "bounds_error",
             "Not all elements were < {bound}",
@@ -170,7 +244,11 @@ def validate_all_lt(arr: ArrT, bound: ty.Any) -> ArrT:
 
 def validate_all_le(arr: ArrT, bound: ty.Any) -> ArrT:
     """Assert all elements in `arr` are <= `bound`"""
-    if not np.all(arr <= bound):
+    if kernel := _bounds_kernel(arr, bound, "le"):
+        ok = kernel(arr.ravel(), bound)
+    else:
+        ok = np.all(arr <= bound)
+    if not ok:
         err = PydanticCustomError(
             "bounds_error",
             "Not all elements were <= {bound}",
@@ -1,9 +1,11 @@
 """Pydantic adapters for shapely types"""
 
+import functools
 import types
 import typing as ty
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
+import numpy as np
 import pydantic
 from numpy.typing import ArrayLike, NDArray
 from pydantic.json_schema import JsonSchemaValue
@@ -13,11 +15,13 @@ from ..numpy.validators import NDArrayValidator
 
 T = ty.TypeVar("T")
 
+_Z_AXIS = 2
 
-class GeometryConstraints(pydantic.BaseModel):
+
+class GeometryConstraints(pydantic.BaseModel, frozen=True):
     """Validation constraints that can be applied to shapely geometries"""
 
-    class CoordinateBounds(pydantic.BaseModel):
+    class CoordinateBounds(pydantic.BaseModel, frozen=True):
         """Bounds checks for coordinates"""
 
         gt: float | None = pydantic.Field(
@@ -33,9 +37,17 @@ class GeometryConstraints(pydantic.BaseModel):
             default=None, description="All coordinates must be <= this value"
         )
 
+        _validator: NDArrayValidator = pydantic.PrivateAttr()
+
+        @pydantic.model_validator(mode="after")
+        def _build_validator(self) -> "GeometryConstraints.CoordinateBounds":
+            """Build the array validator once, rather than per __call__"""
+            self._validator = NDArrayValidator.from_kwargs(**self.model_dump())
+            return self
+
         def __call__(self, coordinates: ArrayLike) -> NDArray:
             """Validate the bounds on the given coordinates"""
-            return NDArrayValidator.from_kwargs(**self.model_dump())(coordinates)
+            return self._validator(coordinates)
 
     dimensionality: ty.Literal[2, 3] | None = pydantic.Field(
         default=None,
@@ -57,7 +69,20 @@ class GeometryConstraints(pydantic.BaseModel):
         description="Bounds for all of the z-coordinates in the geometry",
     )
 
-    def __call__(self, geom: T) -> T:
+    _bounds: tuple[CoordinateBounds | None, ...] = pydantic.PrivateAttr()
+    _unconstrained: bool = pydantic.PrivateAttr()
+
+    def model_post_init(self, context: ty.Any, /) -> None:
+        """Cache the per-dimension bounds for indexed iteration"""
+        del context
+        self._bounds = (self.x_bounds, self.y_bounds, self.z_bounds)
+        self._unconstrained = self.dimensionality is None and self._bounds == (
+            None,
+            None,
+            None,
+        )
+
+    def __call__(self, geom: T) -> T:  # noqa: C901
         """Validate the given shapely geometry w.r.t the given constraints
 
         Parameters
@@ -81,6 +106,9 @@ class GeometryConstraints(pydantic.BaseModel):
             msg = f"the given object ({type(geom).__name__}) was not a shapely geometry"
             raise ValueError(msg)  # noqa: TRY004 (pydantic wants ValueError)
 
+        if self._unconstrained:
+            return geom
+
         has_z = getattr(geom, "has_z", False)
         if self.dimensionality == 2 and has_z:  # noqa: PLR2004
             err_t = "dimensionality"
@@ -91,30 +119,129 @@ class GeometryConstraints(pydantic.BaseModel):
             msg = "Only 3D geometries are allowed."
             raise PydanticCustomError(err_t, msg)
 
-        coords: NDArray | None = None
-        for idx, dim in enumerate("xyz"):
-            bounds = getattr(self, f"{dim}_bounds")
-            if bounds is None or (dim == "z" and not has_z):
+        # Only materialize the z column when a z bounds check will consume it
+        include_z = has_z and self.z_bounds is not None
+
+        col_min: NDArray | None = None
+        col_max: NDArray | None = None
+        for idx, bounds in enumerate(self._bounds):
+            if bounds is None or (idx == _Z_AXIS and not include_z):
                 continue
-            if coords is None:
-                coords = shapely.get_coordinates(geom, include_z=True)
+            if col_min is None:
+                if isinstance(geom, shapely.Point) and not geom.is_empty:
+                    # Scalar attribute access is much cheaper than a
+                    # get_coordinates round-trip through GEOS for a single
+                    # point; the accessors raise GEOSException on empty points
+                    coords = np.array(
+                        [[geom.x, geom.y, geom.z] if include_z else [geom.x, geom.y]]
+                    )
+                else:
+                    coords = shapely.get_coordinates(geom, include_z=include_z)
+                if len(coords) == 0:
+                    break  # no coordinates to bounds-check
+                # Every bounds check only depends on the column extrema, so
+                # one traversal of the coordinate array covers all three dims
+                col_min = coords.min(axis=0)
+                col_max = coords.max(axis=0)
             try:
-                bounds(coords[:, idx])
+                bounds(np.array([col_min[idx], col_max[idx]]))
             except ValueError as e:
                 err_t = "out_of_bounds"
                 msg = "{dim} coordinates failed bounds check: {e}"
-                raise PydanticCustomError(err_t, msg, {"dim": dim, "e": e}) from None
+                raise PydanticCustomError(
+                    err_t, msg, {"dim": "xyz"[idx], "e": e}
+                ) from None
 
         return geom
 
+    def validate_batch(self, geoms: Sequence[T]) -> Sequence[T]:  # noqa: C901, PLR0911, PLR0912
+        """Validate a batch of shapely geometries w.r.t the given constraints
+
+        Equivalent to calling the constraints on each geometry, but crosses
+        into GEOS once for the whole batch instead of once per element.
+
+        Parameters
+        ----------
+        geoms : Sequence[BaseGeometry]
+            The geometries to validate
+
+        Returns
+        -------
+        Sequence[BaseGeometry]
+            The input ``geoms`` (if they all passed validation)
+
+        Raises
+        ------
+        ValueError
+            If any geometry violated one of the user-provided constraints.
+        """
+        import shapely
+
+        if len(geoms) == 0:
+            return geoms
+
+        arr = np.asarray(geoms, dtype=object)
+        try:
+            has_z = shapely.has_z(arr)
+        except (TypeError, shapely.errors.ShapelyError):
+            # Non-geometry in the batch; the scalar path reports which input
+            # was invalid
+            return self._validate_batch_slow(geoms)
+        if shapely.is_missing(arr).any():
+            # shapely treats None as a missing geometry rather than raising,
+            # but the scalar path rejects it
+            return self._validate_batch_slow(geoms)
+
+        if self._unconstrained:
+            return geoms
+
+        if (self.dimensionality == 2 and has_z.any()) or (  # noqa: PLR2004
+            self.dimensionality == 3 and not has_z.all()  # noqa: PLR2004
+        ):
+            return self._validate_batch_slow(geoms)
+
+        if self.x_bounds is None and self.y_bounds is None and self.z_bounds is None:
+            return geoms
+
+        # Only materialize the z column when a z bounds check will consume it
+        include_z = bool(has_z.any()) and self.z_bounds is not None
+
+        coords, index = shapely.get_coordinates(
+            arr, include_z=include_z, return_index=True
+        )
+        if len(coords) == 0:
+            return geoms
+
+        for idx, bounds in enumerate(self._bounds):
+            if bounds is None or (idx == _Z_AXIS and not include_z):
+                continue
+            if idx == _Z_AXIS:
+                # 2D geometries are exempt from the z bounds check
+                column = coords[has_z[index], idx]
+                if len(column) == 0:
+                    continue
+            else:
+                column = coords[:, idx]
+            try:
+                bounds(np.array([column.min(), column.max()]))
+            except ValueError:
+                return self._validate_batch_slow(geoms)
+
+        return geoms
+
+    def _validate_batch_slow(self, geoms: Sequence[T]) -> Sequence[T]:
+        """Element-by-element fallback for precise batch error reporting"""
+        for geom in geoms:
+            self(geom)
+        return geoms
+
     def summary(self) -> str:
         """Make a summary of the constraints"""
         constraints = []
         if self.dimensionality is not None:
             constraints.append(f"dimensionality = {self.dimensionality}")
 
-        for dim in "xyz":
-            bounds = getattr(self, f"{dim}_bounds")
+        for dim, bounds in zip("xyz", self._bounds, strict=True):
             if bounds is None:
                 continue
             for field, sign in (("le", "<="), ("lt", "<"), ("gt", ">"), ("ge", ">=")):
@@ -158,11 +285,32 @@ class GeometryAdapter:
 
         allowable_types = _get_allowable_types(source_type)
 
-        def validate(value: ty.Any) -> ty.Any:
-            if isinstance(value, shapely.geometry.base.BaseGeometry):
+        # Hoist per-call invariants out of the validator: the base-geometry
+        # attribute chain and the expected-types error text never change for
+        # a given schema
+        base_geometry = shapely.geometry.base.BaseGeometry
+        if len(allowable_types) == 1:
+            expected = f"Expected {allowable_types[0].__name__}."
+        else:
+            expected = (
+                f"Expected one of: {', '.join(t.__name__ for t in allowable_types)}."
+            )
+
+        # The hot names are bound as argument defaults so the per-call path
+        # runs on local loads instead of closure-cell/global lookups
+        def validate(
+            value: ty.Any,
+            *,
+            _base_geometry: type = base_geometry,
+            _allowable_types: tuple[type, ...] = allowable_types,
+            _expected: str = expected,
+            _parse: ty.Callable[[str], ty.Any] = _parse_str,
+            _validator: GeometryConstraints = self._validator,
+        ) -> ty.Any:
+            if isinstance(value, _base_geometry):
                 pass
             elif isinstance(value, str):
-                value = _parse_str(value)
+                value = _parse(value)
             elif (is_mapping := isinstance(value, Mapping)) or hasattr(
                 value, "__geo_interface__"
             ):
@@ -178,20 +326,13 @@ class GeometryAdapter:
                     err_t = "invalid_geojson"
                     raise PydanticCustomError(err_t, msg, {"e": e}) from e
 
-            if not isinstance(value, allowable_types):
+            if not isinstance(value, _allowable_types):
                 msg = "Value was of incorrect type: {t}. {exp}"
-                subs = {"t": type(value).__name__}
-                if len(allowable_types) == 1:
-                    subs["exp"] = f"Expected {allowable_types[0].__name__}."
-                else:
-                    subs["exp"] = (
-                        "Expected one of: "
-                        f"{', '.join(t.__name__ for t in allowable_types)}."
-                    )
+                subs = {"t": type(value).__name__, "exp": _expected}
                 err_t = "geometry_type"
                 raise PydanticCustomError(err_t, msg, subs)
 
-            return self._validator(value)
+            return _validator(value)
 
         def serialize(geom: shapely.geometry.base.BaseGeometry) -> dict[str, ty.Any]:
             return geom.__geo_interface__
@@ -230,11 +371,20 @@ class GeometryAdapter:
         return json_schema
 
 
+@functools.lru_cache(maxsize=256)
 def _get_allowable_types(source_type: ty.Any) -> tuple[type, ...]:
-    """Get the allowable geometry types from the field annotation"""
+    """Get the allowable geometry types from the field annotation
+
+    Cached so models repeatedly built with the same annotation share one
+    resolved tuple.
+    """
     import shapely
 
     if isinstance(source_type, type):
+        # Single-type annotations are the overwhelmingly common case; skip
+        # the union unpacking and list-building audit below
+        if issubclass(source_type, shapely.geometry.base.BaseGeometry):
+            return (source_type,)
         allowable_types = (source_type,)
     else:
         origin = ty.get_origin(source_type)
@@ -1,6 +1,8 @@
 """Pydantic adapter for slice's"""
 
+import functools
 import numbers
+import re
 import typing as ty
 from collections.abc import Mapping, Sequence
 
@@ -8,11 +10,11 @@ import pydantic
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import core_schema
 
-from scientific_pydantic.slice_syntax import (
-    SliceSyntaxError,
-    format_slice_syntax,
-    parse_slice_syntax,
-)
+from scientific_pydantic.slice_syntax import format_slice_syntax
+
+# Compiled once at import: [start]:[stop][:step], where no component may
+# itself contain a colon
+_SLICE_RE = re.compile(r"^([^:]*):([^:]*)(?::([^:]*))?$")
 
 
 class SliceAdapter:
@@ -29,74 +31,74 @@ class SliceAdapter:
         stop_type: type | None = None,
         step_type: type | None = None,
     ) -> None:
-        distinct_types = {default_type, start_type, stop_type, step_type}
-        adapters = {
-            t: pydantic.TypeAdapter(t) for t in distinct_types if t not in (None, str)
-        }
+        self._int_components = all(
+            (t if t is not None else default_type) is int
+            for t in (start_type, stop_type, step_type)
+        )
         self._default_adapter = (
-            adapters[default_type] if default_type is not str else None
+            _get_type_adapter(default_type) if default_type is not str else None
         )
 
         self._start_adapter = (
-            adapters[start_type]
+            _get_type_adapter(start_type)
             if start_type not in (str, None)
             else self._default_adapter
         )
         self._stop_adapter = (
-            adapters[stop_type]
+            _get_type_adapter(stop_type)
             if stop_type not in (str, None)
             else self._default_adapter
         )
         self._step_adapter = (
-            adapters[step_type]
+            _get_type_adapter(step_type)
             if step_type not in (str, None)
             else self._default_adapter
         )
 
-    def __get_pydantic_core_schema__(  # noqa: C901
+    def validate_array(self, arr: ty.Any) -> list[slice]:
+        """Validate an (N, 3) array of slice components into N slices
+
+        A single ``tolist`` call converts the whole batch at C level, and for
+        integer arrays with integer component types the per-component type
+        adapters are skipped entirely.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            An (N, 3) array whose rows are ``(start, stop, step)``
+
+        Returns
+        -------
+        list[slice]
+            The validated slices
+        """
+        import numpy as np
+
+        if not (isinstance(arr, np.ndarray) and arr.ndim == 2 and arr.shape[1] == 3):  # noqa: PLR2004
+            msg = "Expected an (N, 3) array of slice components"
+            raise ValueError(msg)
+
+        rows = arr.tolist()
+        if self._int_components and np.issubdtype(arr.dtype, np.integer):
+            return [slice(start, stop, step) for start, stop, step in rows]
+
+        validate = _make_validator(
+            self._start_adapter, self._stop_adapter, self._step_adapter
+        )
+        return [validate(row) for row in rows]
+
+    def __get_pydantic_core_schema__(
         self,
         _source_type: ty.Any,
         _handler: pydantic.GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
         """Get the pydantic schema for this type"""
-
-        def _validate(value: ty.Any) -> slice:
-            match value:
-                case slice():
-                    return value
-                case Mapping():
-                    start, stop, step = _from_mapping(value)
-                case str():
-                    start, stop, step = _from_str(value)
-                case Sequence():
-                    start, stop, step = _from_sequence(value)
-                case _:
-                    msg = "Expected a slice, sequence, mapping or str"
-                    raise ValueError(msg)
-
-            if start is not None and self._start_adapter is not None:
-                start = self._start_adapter.validate_python(start)
-            if stop is not None and self._stop_adapter is not None:
-                stop = self._stop_adapter.validate_python(stop)
-            if step is not None and self._step_adapter is not None:
-                step = self._step_adapter.validate_python(step)
-            return slice(start, stop, step)
-
-        def _serialize(value: slice) -> str | dict[str, ty.Any]:
-            if all(
-                x is None or isinstance(x, numbers.Number)
-                for x in (value.start, value.stop, value.step)
-            ):
-                return format_slice_syntax(value.start, value.stop, value.step)
-
-            return {
-                "start": value.start,
-                "stop": value.stop,
-                "step": value.step,
-            }
-
         return core_schema.no_info_plain_validator_function(
-            _validate,
+            _make_validator(
+                self._start_adapter,
+                self._stop_adapter,
+                self._step_adapter,
+            ),
             serialization=core_schema.plain_serializer_function_ser_schema(
                 _serialize,
                 when_used="json",
@@ -139,26 +141,114 @@ class SliceAdapter:
         )
 
 
+@functools.cache
+def _get_type_adapter(t: type) -> pydantic.TypeAdapter:
+    """Get the (cached) `TypeAdapter` for a slice component type.
+
+    Schema generation is the dominant cost of `TypeAdapter` construction, so
+    adapters are shared across all `SliceAdapter` instances.
+    """
+    return pydantic.TypeAdapter(t)
+
+
 IntSliceAdapter = SliceAdapter(int)
 
 
+def _make_validator(
+    start_adapter: pydantic.TypeAdapter | None,
+    stop_adapter: pydantic.TypeAdapter | None,
+    step_adapter: pydantic.TypeAdapter | None,
+) -> ty.Callable[[ty.Any], slice]:
+    """Build the validation function for the given component adapters
+
+    The adapters are bound as argument defaults so the hot path reads locals
+    rather than closure cells.
+    """
+
+    def _validate(
+        value: ty.Any,
+        *,
+        _start_adapter: pydantic.TypeAdapter | None = start_adapter,
+        _stop_adapter: pydantic.TypeAdapter | None = stop_adapter,
+        _step_adapter: pydantic.TypeAdapter | None = step_adapter,
+        _dispatch_get: ty.Callable[
+            [type], ty.Callable[[ty.Any], tuple[ty.Any, ty.Any, ty.Any]] | None
+        ] = _DISPATCH.get,
+    ) -> slice:
+        if type(value) is slice:
+            return value
+
+        # Exact-type dispatch avoids the (slow) Mapping/Sequence ABC
+        # isinstance checks for the common input types
+        if (convert := _dispatch_get(type(value))) is not None:
+            start, stop, step = convert(value)
+        elif isinstance(value, Mapping):
+            start, stop, step = _from_mapping(value)
+        elif isinstance(value, str):
+            start, stop, step = _from_str(value)
+        elif isinstance(value, Sequence):
+            start, stop, step = _from_sequence(value)
+        else:
+            msg = "Expected a slice, sequence, mapping or str"
+            raise ValueError(msg)
+
+        if start is not None and _start_adapter is not None:
+            start = _start_adapter.validate_python(start)
+        if stop is not None and _stop_adapter is not None:
+            stop = _stop_adapter.validate_python(stop)
+        if step is not None and _step_adapter is not None:
+            step = _step_adapter.validate_python(step)
+        return slice(start, stop, step)
+
+    return _validate
+
+
+# Exact types checked before the numbers.Number ABC in _serialize; for the
+# common adapters (e.g. IntSliceAdapter) every component hits this fast path
+_NUMERIC_TYPES: ty.Final = frozenset({int, float, complex})
+
+
+def _is_numeric(x: ty.Any) -> bool:
+    return x is None or type(x) in _NUMERIC_TYPES or isinstance(x, numbers.Number)
+
+
+def _serialize(value: slice) -> str | dict[str, ty.Any]:
+    if _is_numeric(value.start) and _is_numeric(value.stop) and _is_numeric(value.step):
+        return format_slice_syntax(value.start, value.stop, value.step)
+
+    return {
+        "start": value.start,
+        "stop": value.stop,
+        "step": value.step,
+    }
+
+
+_SLICE_KEYS: ty.Final = frozenset(("start", "stop", "step"))
+
+
 def _from_mapping(value: Mapping[str, ty.Any]) -> tuple[ty.Any, ty.Any, ty.Any]:
-    if any(x not in ("start", "stop", "step") for x in value):
+    # A single C-level set comparison instead of a Python loop over the keys
+    if not _SLICE_KEYS.issuperset(value.keys()):
         msg = 'Invalid key for slice, can only accept "start"/"stop"/"step"'
         raise ValueError(msg)
     return (value.get("start"), value.get("stop"), value.get("step"))
 
 
 def _from_str(value: str) -> tuple[ty.Any, ty.Any, ty.Any]:
-    try:
-        start, stop, step = parse_slice_syntax(
-            value,
-            converter=str,
-            require_start=False,
-            require_stop=True,
-        )
-    except SliceSyntaxError as exc:
-        raise ValueError(str(exc)) from exc
+    # Equivalent to parse_slice_syntax(value, converter=str,
+    # require_start=False, require_stop=True), but a single pass over the
+    # precompiled pattern instead of split + per-part Python scanning
+    parsed = _SLICE_RE.match(value)
+    if parsed is None:
+        msg = "Invalid slice syntax"
+        raise ValueError(msg)
+
+    start, stop, step = (
+        part.strip() or None if part is not None else None for part in parsed.groups()
+    )
+    if stop is None:
+        msg = "Stop is required"
+        raise ValueError(msg)
 
     return (start, stop, step)
 
@@ -168,3 +258,15 @@ def _from_sequence(value: Sequence[ty.Any]) -> tuple[ty.Any, ty.Any, ty.Any]:
         return tuple(value)
     msg = "A sequence input to slice must have 1-3 elements"
     raise ValueError(msg)
+
+
+# Fast-path dispatch on exact type for the common input types. Subclasses and
+# other Mapping/Sequence implementations fall back to the isinstance ladder.
+_DISPATCH: ty.Final[
+    dict[type, ty.Callable[[ty.Any], tuple[ty.Any, ty.Any, ty.Any]]]
+] = {
+    str: _from_str,
+    list: _from_sequence,
+    tuple: _from_sequence,
+    dict: _from_mapping,
+}
@@ -8,6 +8,12 @@ import pytest
 from numpy.typing import ArrayLike
 
 from scientific_pydantic.numpy import NDArrayAdapter
+from scientific_pydantic.numpy.validators import (
+    validate_all_ge,
+    validate_all_gt,
+    validate_all_le,
+    validate_all_lt,
+)
 
 
 class DefaultModel(pydantic.BaseModel):
@@ -506,3 +512,32 @@ def test_shape(*, shape: tuple, input_shape: tuple, should_pass: bool) -> None:
     else:
         with pytest.raises(pydantic.ValidationError, match="does not match spec"):
             Model(arr=data)
+
+
+@pytest.mark.parametrize(
+    ("validator", "bound", "good", "bad"),
+    [
+        pytest.param(validate_all_gt, 0.0, 0.5, 0.0, id="gt"),
+        pytest.param(validate_all_ge, 0.0, 0.0, -0.5, id="ge"),
+        pytest.param(validate_all_lt, 1.0, 0.5, 1.0, id="lt"),
+        pytest.param(validate_all_le, 1.0, 1.0, 1.5, id="le"),
+    ],
+)
+def test_bounds_large_array(
+    validator: ty.Callable,
+    bound: float,
+    good: float,
+    bad: float,
+) -> None:
+    """Bounds checks on arrays large enough for the compiled kernel path"""
+    arr = np.full(2048, good)
+    assert validator(arr, bound) is arr
+
+    arr[-1] = bad
+    with pytest.raises(ValueError, match="Not all elements were"):
+        validator(arr, bound)
+
+    # NaN fails every bounds check, matching the np.all reductions
+    arr[-1] = np.nan
+    with pytest.raises(ValueError, match="Not all elements were"):
+        validator(arr, bound)
@@ -140,6 +140,7 @@ class GeometryModel(pydantic.BaseModel, frozen=True, extra="forbid"):
         ),
         pytest.param({"point3d": shapely.Point(2, 3, 4)}, id="point3d"),
         pytest.param({"point2d_01": shapely.Point(0, 1)}, id="point2d_01"),
+        pytest.param({"point2d_01": shapely.Point()}, id="point2d_01-empty"),
         pytest.param(
             {"linear_ring2d": shapely.LinearRing([(0, 1), (1, 0), (1, 1)])},
             id="linear_ring2d",
@@ -304,6 +305,96 @@ def test_wkt_list_deserialization() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("params", "geoms"),
+    [
+        pytest.param({}, [], id="empty-batch"),
+        pytest.param({}, [shapely.Point(0, 1), shapely.Point(2, 3)], id="no-bounds"),
+        pytest.param(
+            {"x_bounds": {"ge": 0}, "y_bounds": {"le": 10}},
+            [shapely.Point(0, 1), shapely.MultiPoint([(1, 2), (3, 4)])],
+            id="in-bounds",
+        ),
+        pytest.param(
+            {"dimensionality": 2, "z_bounds": {"ge": 0}},
+            [shapely.Point(0, 1), shapely.Point(2, 3)],
+            id="2d-no-z-check",
+        ),
+        pytest.param(
+            {"z_bounds": {"ge": 0}},
+            [shapely.Point(0, 1), shapely.Point(2, 3, 4)],
+            id="mixed-dim-z-check",
+        ),
+        pytest.param(
+            {"x_bounds": {"ge": 0}},
+            [shapely.MultiPoint([]), shapely.Point(1, 2)],
+            id="with-empty-geom",
+        ),
+        pytest.param(
+            {"x_bounds": {"ge": 0}},
+            [shapely.Point(), shapely.Point(1, 2)],
+            id="with-empty-point",
+        ),
+    ],
+)
+def test_validate_batch_valid(
+    params: dict[str, ty.Any], geoms: list[shapely.geometry.base.BaseGeometry]
+) -> None:
+    """Test passing cases for batched validation"""
+    constraints = GeometryConstraints(**params)
+    assert constraints.validate_batch(geoms) is geoms
+
+
+@pytest.mark.parametrize(
+    ("params", "geoms", "match"),
+    [
+        pytest.param(
+            {"dimensionality": 3},
+            [shapely.Point(0, 1, 2), shapely.Point(2, 3)],
+            "Only 3D geometries are allowed",
+            id="2d-in-3d-batch",
+        ),
+        pytest.param(
+            {"x_bounds": {"ge": 0}},
+            [shapely.Point(0, 1), shapely.Point(-2, 3)],
+            "x coordinates failed bounds check",
+            id="x-out",
+        ),
+        pytest.param(
+            {"x_bounds": {"ge": 0}},
+            [shapely.Point(), shapely.Point(-2, 3)],
+            "x coordinates failed bounds check",
+            id="x-out-with-empty-point",
+        ),
+        pytest.param(
+            {"z_bounds": {"lt": 10}},
+            [shapely.Point(0, 1), shapely.Point(2, 3, 11)],
+            "z coordinates failed bounds check",
+            id="z-out",
+        ),
+        pytest.param(
+            {},
+            [shapely.Point(0, 1), 5],
+            "was not a shapely geometry",
+            id="non-geometry",
+        ),
+        pytest.param(
+            {},
+            [shapely.Point(0, 1), None],
+            "was not a shapely geometry",
+            id="none-geometry",
+        ),
+    ],
+)
+def test_validate_batch_invalid(
+    params: dict[str, ty.Any], geoms: list[ty.Any], match: str
+) -> None:
+    """Test failing cases for batched validation"""
+    constraints = GeometryConstraints(**params)
+    with pytest.raises(ValueError, match=match):
+        constraints.validate_batch(geoms)
+
+
 def test_constaints_bad_type() -> None:
     """Test GeometryConstraints raises on an invalid type"""
     with pytest.raises(ValueError, match="was not a shapely geometry"):
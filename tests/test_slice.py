@@ -2,6 +2,7 @@
 
 import typing as ty
 
+import numpy as np
 import pydantic
 import pytest
 
@@ -100,6 +101,33 @@ def test_json_schema() -> None:
     }
 
 
+def test_validate_array() -> None:
+    """Batched validation of an (N, 3) integer array"""
+    arr = np.array([[0, 10, 2], [5, 50, 1]])
+    assert IntSliceAdapter.validate_array(arr) == [slice(0, 10, 2), slice(5, 50, 1)]
+
+    # Non-integer dtypes go through the component adapters
+    assert IntSliceAdapter.validate_array(arr.astype(float)) == [
+        slice(0, 10, 2),
+        slice(5, 50, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        pytest.param([[0, 10, 2]], id="list"),
+        pytest.param("0:10:2", id="str"),
+        pytest.param(np.array([0, 10, 2]), id="1d"),
+        pytest.param(np.array([[0, 10], [5, 50]]), id="two-columns"),
+    ],
+)
+def test_validate_array_invalid(arr: ty.Any) -> None:
+    """Inputs that are not (N, 3) numpy arrays are rejected"""
+    with pytest.raises(ValueError, match=r"Expected an \(N, 3\) array"):
+        IntSliceAdapter.validate_array(arr)
+
+
 def test_datetime_timedelta() -> None:
     """Make a heterogenuous slice"""
     import datetime